@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Postcard Video Creator - Render Benchmark
+Times each stage of rendering one video part and writes the results as JSON,
+so runs from different versions can be compared.
+
+Stages, per resolution:
+    decode       decode + letterbox one image (no cache)
+    clip_build   plan the segments and build their clips
+    transitions  compositing time per frame for each transition effect
+    encode       raw ffmpeg throughput for distinct frames
+    segments     build + composite + encode every segment of the part
+    mux          join the segments (and music, with --music)
+    total        clip_build + segments + mux, also per second of output video
+
+Usage:
+    python benchmark_render.py                       # bundled test_images, 720p/1080p/4K
+    python benchmark_render.py --pairs 40 --resolutions 1080p --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RESOLUTIONS = {
+    "720p": "1280x720",
+    "1080p": "1920x1080",
+    "4k": "3840x2160",
+    "square": "1080x1080 (Square)",
+}
+TRANSITION_EFFECTS = ["fade", "slide_left", "wipe_left", "dissolve", "zoom_in", "zoom_out"]
+BUNDLED_PAIRS = 5  # test_images/postcard_{1..5}_{front,back}.jpg
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the stages of rendering a postcard video")
+    parser.add_argument("--pairs", type=int, default=BUNDLED_PAIRS,
+                        help=f"Postcard pairs in the part (more than {BUNDLED_PAIRS} generates synthetic postcards)")
+    parser.add_argument("--image-size", default="800x600", help="Size of synthetic postcards (default: 800x600)")
+    parser.add_argument("--resolutions", nargs="+", default=["720p", "1080p", "4k"], choices=sorted(RESOLUTIONS))
+    parser.add_argument("--fps", type=int, default=10, help="Output frame rate (default: 10)")
+    parser.add_argument("--defaults", default="", help="Settings saved from the GUI (default: built-in defaults)")
+    parser.add_argument("--music", default="None", help="Background music name, or None (default)")
+    parser.add_argument("--encode-seconds", type=float, default=2.0, help="Video length for the raw encode test")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def timed(function, *args, **kwargs):
+    """Call function, returning (result, seconds)"""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def get_git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def prepare_images(pairs, image_size, work_dir):
+    """Return image paths (front, back, ...) for the requested number of pairs"""
+    image_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_images")
+    bundled = [os.path.join(image_dir, f"postcard_{i}_{side}.jpg")
+               for i in range(1, BUNDLED_PAIRS + 1) for side in ("front", "back")]
+    if pairs <= BUNDLED_PAIRS and all(os.path.exists(path) for path in bundled):
+        return bundled[:pairs * 2]
+
+    from create_test_images import create_sample_postcard
+
+    width, height = (int(value) for value in image_size.lower().split("x"))
+    image_dir = os.path.join(work_dir, "images")
+    os.makedirs(image_dir, exist_ok=True)
+    paths = []
+    for i in range(1, pairs + 1):
+        for side in ("front", "back"):
+            path = os.path.join(image_dir, f"postcard_{i}_{side}.jpg")
+            create_sample_postcard(front=side == "front", postcard_num=i, size=(width, height)).save(path, "JPEG", quality=95)
+            paths.append(path)
+    log(f"Generated {pairs} synthetic postcard pairs at {width}x{height}")
+    return paths
+
+def create_creator(args, resolution, image_paths, output_dir):
+    import postcard_video_creator as pvc
+
+    creator = pvc.PostcardVideoCreator.create_headless(
+        defaults_path=args.defaults or os.path.join(output_dir, "no_defaults.json"),
+        output_path=output_dir,
+        resolution=resolution,
+    )
+    creator.fps_var.set(args.fps)
+    creator.music_var.set(args.music)
+    creator.postcard_images = list(image_paths)
+    creator.image_durations = [creator.default_duration] * len(image_paths)
+    creator.image_included = [True] * len(image_paths)
+    return creator
+
+def time_transitions(creator, image_paths, fps):
+    """Milliseconds per composited frame for every transition effect"""
+    from postcard_video_creator import VideoTimeline
+
+    transition_duration = creator.transition_duration or 1.0
+    creator.transition_duration = transition_duration
+    front = creator.create_image_clip(image_paths[0], 2.0)
+    back = creator.create_image_clip(image_paths[1], 2.0)
+    next_front = creator.create_image_clip(image_paths[2 % len(image_paths)], transition_duration)
+    frame_times = [i / fps for i in range(max(2, int(round(transition_duration * fps))))]
+
+    results = {}
+    for effect in TRANSITION_EFFECTS:
+        clip = creator.create_transition(front, back, effect=effect)
+        start = 0.0 if effect in VideoTimeline.SHORT_EFFECTS else front.duration
+        _, seconds = timed(lambda: [clip.get_frame(start + t) for t in frame_times])
+        results[effect] = round(seconds / len(frame_times) * 1000, 3)
+
+    # The in-video pair transition: front -> back, then a preview of the next front
+    total = front.duration + transition_duration + back.duration + transition_duration
+    clip = creator.create_enhanced_pair_transition(front, back, next_front, total)
+    window = [front.duration + t for t in frame_times] + [total - transition_duration + t for t in frame_times]
+    _, seconds = timed(lambda: [clip.get_frame(t) for t in window])
+    results["pair_preview"] = round(seconds / len(window) * 1000, 3)
+    return results
+
+def time_encode(creator, fps, seconds, work_dir):
+    """Milliseconds per frame to encode distinct frames with ffmpeg"""
+    import numpy as np
+
+    num_frames = max(1, int(round(seconds * fps)))
+    frames = [np.full((creator.video_height, creator.video_width, 3), value, dtype=np.uint8)
+              for value in (40, 200)]
+    for i, frame in enumerate(frames):
+        frame[:, i::7] = 255 - frame[:, i::7]  # Some detail so the encoder has work to do
+
+    out = creator._open_video_writer(os.path.join(work_dir, "encode_test.mp4"), fps)
+    start = time.perf_counter()
+    try:
+        for i in range(num_frames):
+            out.write(frames[i % 2])
+    except Exception:
+        out.abort()
+        raise
+    out.close()
+    return round((time.perf_counter() - start) / num_frames * 1000, 3)
+
+def benchmark_resolution(args, name, image_paths, work_dir):
+    """Run every stage at one resolution and return the timings"""
+    import postcard_video_creator as pvc
+
+    output_dir = os.path.join(work_dir, name)
+    os.makedirs(output_dir, exist_ok=True)
+    creator = create_creator(args, RESOLUTIONS[name], image_paths, output_dir)
+    fps = creator.get_render_fps()
+    # Start cold and in memory so every run measures the same work
+    pvc._image_cache = pvc.DecodedImageCache(max_bytes=1024 * 1024 * 1024)
+    log(f"[{name}] {creator.video_width}x{creator.video_height} at {fps} fps, {len(image_paths) // 2} pairs")
+
+    decode_times = [timed(creator._render_letterboxed_image, path)[1] for path in image_paths]
+
+    def build_clips():
+        segments = creator._plan_batch_segments(list(range(len(image_paths))))
+        return segments, [creator._build_segment_clips(segment) for segment in segments]
+
+    (segments, segment_clips), build_seconds = timed(build_clips)
+    durations = [sum(clip.duration for clip in clips) for clips in segment_clips]
+    segment_starts = [sum(durations[:i]) for i in range(len(durations))]
+    total_frames = sum(num_frames for num_frames, _ in pvc.plan_clip_frames(durations, fps))
+    video_duration = total_frames / fps
+    for clips in segment_clips:
+        for clip in clips:
+            clip.close()
+    log(f"[{name}] decode {sum(decode_times):.2f}s, clip build {build_seconds:.2f}s, {video_duration:.1f}s of video")
+
+    transitions = time_transitions(creator, image_paths, fps)
+    log(f"[{name}] transitions (ms/frame): {transitions}")
+    encode_ms = time_encode(creator, fps, args.encode_seconds, output_dir)
+
+    segment_paths = []
+    start = time.perf_counter()
+    for index, segment in enumerate(segments):
+        path = creator._encode_segment(segment, os.path.join(output_dir, f"segment_{index:04d}.mp4"), fps,
+                                       segment_starts[index])
+        if path:
+            segment_paths.append(path)
+    segment_seconds = time.perf_counter() - start
+
+    music_path = creator._resolve_music_path()
+    _, mux_seconds = timed(pvc.concat_video_segments, segment_paths, os.path.join(output_dir, "benchmark.mp4"),
+                           output_settings=pvc.load_app_config().get('output_settings', {}),
+                           music_path=music_path, music_volume=creator.music_volume_var.get(),
+                           video_duration=video_duration)
+    total_seconds = build_seconds + segment_seconds + mux_seconds
+    log(f"[{name}] segments {segment_seconds:.2f}s, mux {mux_seconds:.2f}s, "
+        f"{total_seconds / video_duration:.3f}s per output second")
+
+    return {
+        "size": [creator.video_width, creator.video_height],
+        "video_seconds": round(video_duration, 3),
+        "frames": total_frames,
+        "decode": {
+            "images": len(decode_times),
+            "total_s": round(sum(decode_times), 4),
+            "per_image_ms": round(sum(decode_times) / len(decode_times) * 1000, 3),
+        },
+        "clip_build_s": round(build_seconds, 4),
+        "transition_ms_per_frame": transitions,
+        "encode_ms_per_frame": encode_ms,
+        "segments": {"count": len(segment_paths), "total_s": round(segment_seconds, 4)},
+        "mux_s": round(mux_seconds, 4),
+        "music": bool(music_path),
+        "total_s": round(total_seconds, 4),
+        "seconds_per_output_second": round(total_seconds / video_duration, 4),
+    }
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.pairs < 1:
+        log("--pairs must be at least 1")
+        return 2
+
+    import cv2
+    import numpy as np
+
+    work_dir = tempfile.mkdtemp(prefix="postcard_benchmark_")
+    try:
+        image_paths = prepare_images(args.pairs, args.image_size, work_dir)
+        results = {
+            "revision": get_git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+            "fps": args.fps,
+            "pairs": len(image_paths) // 2,
+            "resolutions": {},
+        }
+        for name in args.resolutions:
+            results["resolutions"][name] = benchmark_resolution(args, name, image_paths, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+        log(f"Results written to {args.output}")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
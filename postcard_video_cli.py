@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Postcard Video Creator - Command Line
+Renders postcard videos without the GUI, e.g. from cron on a headless server.
+
+Progress is written to stdout as JSON lines, one event per line:
+    {"event": "status", "message": "..."}
+    {"event": "progress", "percent": 42.0}
+    {"event": "parts", "count": 3, "pairs": [5, 5, 4]}
+    {"event": "done", "videos": ["..."], "expected_parts": 3}
+    {"event": "error", "message": "..."}
+Everything else the renderer prints goes to stderr.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+RESOLUTIONS = ["1920x1080", "1280x720", "3840x2160", "1080x1080 (Square)", "720x720 (Square)"]
+FRAME_RATES = [10, 24, 30, 60]  # Same as postcard_video_creator.FRAME_RATES, without importing it for --help
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render postcard videos without the GUI")
+    parser.add_argument("images", nargs="*",
+                        help="Image paths in order: front1 back1 front2 back2 ...")
+    parser.add_argument("--image-list", help="Text file with one image path per line (same order as above)")
+    parser.add_argument("--excel", help="Excel file with postcard titles and image URLs")
+    parser.add_argument("--defaults", default="defaults.json", help="Settings saved from the GUI (default: defaults.json)")
+    parser.add_argument("--output", required=True, help="Folder to write the videos to")
+    parser.add_argument("--title", help="Start screen title (default: start_line1 from the defaults)")
+    parser.add_argument("--resolution", default="1080x1080 (Square)", choices=RESOLUTIONS)
+    parser.add_argument("--workers", type=int, help="Parts to render at once (default: render_workers from the defaults)")
+    parser.add_argument("--fps", type=int, choices=FRAME_RATES, help="Output frame rate (default: fps from the defaults)")
+    parser.add_argument("--starting-part", type=int, help="Number of the first part")
+    return parser.parse_args(argv)
+
+def run(args, emit):
+    """Render the videos described by args; returns the process exit code"""
+    from postcard_video_creator import PostcardVideoCreator
+
+    last_percent = [None]
+
+    def report_progress(percent):
+        percent = round(percent, 1)
+        if percent != last_percent[0]:  # Render workers report the same value repeatedly
+            last_percent[0] = percent
+            emit("progress", percent=percent)
+
+    creator = PostcardVideoCreator.create_headless(
+        defaults_path=args.defaults,
+        output_path=args.output,
+        resolution=args.resolution,
+        status_callback=lambda text: emit("status", message=text),
+        progress_callback=report_progress,
+    )
+    if args.title is not None:
+        creator.start_line1_var.set(args.title)
+    if args.workers is not None:
+        creator.render_workers_var.set(max(1, args.workers))
+    if args.fps is not None:
+        creator.fps_var.set(args.fps)
+    if args.starting_part is not None:
+        creator.starting_part_var.set(args.starting_part)
+
+    image_paths = list(args.images)
+    if args.image_list:
+        image_paths.extend(creator.read_image_list(args.image_list))
+    if args.excel:
+        image_paths.extend(creator.download_excel_images(args.excel, lambda text: emit("status", message=text)))
+
+    missing = [path for path in image_paths if not os.path.exists(path)]
+    if missing:
+        emit("error", message=f"Image not found: {missing[0]}")
+        return 2
+    if not image_paths or len(image_paths) % 2 != 0:
+        emit("error", message="You must have an even number of images (front and back for each postcard)")
+        return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    creator.postcard_images = image_paths
+    creator.image_durations = [creator.default_duration] * len(image_paths)
+    creator.image_included = [True] * len(image_paths)
+
+    batches = creator.calculate_video_batches()
+    emit("parts", count=len(batches), pairs=[len(batch) // 2 for batch in batches])
+
+    videos = creator.render_batches(batches)
+    report_progress(100.0)
+    emit("done", videos=videos, expected_parts=len(batches))
+    return 0 if len(videos) == len(batches) else 1
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = parse_args(argv)
+
+    # Keep stdout for progress events: point file descriptor 1 (used by prints,
+    # worker processes and ffmpeg) at stderr and write events to a duplicate.
+    events = os.fdopen(os.dup(sys.stdout.fileno()), 'w', buffering=1, encoding='utf-8')
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    def emit(event, **fields):
+        events.write(json.dumps(dict(event=event, **fields)) + "\n")
+
+    try:
+        return run(args, emit)
+    except Exception as e:
+        emit("error", message=str(e))
+        return 1
+    finally:
+        events.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
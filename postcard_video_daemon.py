@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Postcard Video Creator - Watch Folder Service
+Watches an inbox for new postcard jobs, queues them in SQLite and renders them
+without a desktop session.
+
+Each job is either an .xlsx sheet in the inbox or a sub-folder of images. The
+images are used in file name order, numbers by value and front before back
+(front1, back1, front2, back2, ..., front10, back10), unless the folder has an images.txt listing them, one per line. A folder may also
+contain a title.txt with the start screen title. Jobs and their parts are
+recorded in the queue database, so after a restart unfinished jobs resume and
+parts that were already rendered are not rendered again.
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
+def get_watch_settings():
+    """Return the watch-folder settings from config.json, with defaults"""
+    from postcard_video_creator import load_app_config
+
+    settings = {
+        'inbox_dir': os.path.join('watch', 'inbox'),
+        'output_dir': os.path.join('watch', 'videos'),
+        'queue_db': os.path.join('watch', 'render_queue.db'),
+        'defaults_path': 'defaults.json',
+        'resolution': "1080x1080 (Square)",
+        'poll_interval': 10,
+        'settle_seconds': 30,
+        'workers': None,
+    }
+    settings.update(load_app_config().get('watch', {}))
+    return settings
+
+class RenderQueue:
+    """Durable job queue: jobs move queued -> running -> done/failed, parts the same"""
+
+    def __init__(self, db_path):
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    images TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    UNIQUE (source, fingerprint)
+                );
+                CREATE TABLE IF NOT EXISTS parts (
+                    job_id INTEGER NOT NULL REFERENCES jobs(id),
+                    part_number INTEGER NOT NULL,
+                    batch TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    output_path TEXT,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (job_id, part_number)
+                );
+            """)
+
+    def _now(self):
+        return datetime.now().isoformat(timespec='seconds')
+
+    def enqueue(self, source, fingerprint, kind):
+        """Add a job unless this version of the source was already queued; returns the new job id or None"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (source, fingerprint, kind, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (source, fingerprint, kind, self._now(), self._now()))
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def reset_interrupted(self):
+        """Requeue jobs and parts left running by a process that stopped"""
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET status = 'queued' WHERE status = 'running'")
+            self.conn.execute("UPDATE parts SET status = 'queued' WHERE status = 'running'")
+
+    def retry_failed(self):
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET status = 'queued', error = NULL WHERE status = 'failed'")
+            self.conn.execute("UPDATE parts SET status = 'queued' WHERE status = 'failed'")
+
+    def next_job(self):
+        return self.conn.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+
+    def set_job_status(self, job_id, status, error=None):
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                              (status, error, self._now(), job_id))
+
+    def set_job_images(self, job_id, images):
+        with self.conn:
+            self.conn.execute("UPDATE jobs SET images = ?, updated_at = ? WHERE id = ?",
+                              (json.dumps(images), self._now(), job_id))
+
+    def add_parts(self, job_id, parts):
+        """Record the planned (part_number, batch_indices) parts of a job"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO parts (job_id, part_number, batch, updated_at) VALUES (?, ?, ?, ?)",
+                [(job_id, part_number, json.dumps(batch), self._now()) for part_number, batch in parts])
+
+    def get_parts(self, job_id):
+        rows = self.conn.execute("SELECT * FROM parts WHERE job_id = ? ORDER BY part_number", (job_id,)).fetchall()
+        return [dict(row, batch=json.loads(row['batch'])) for row in rows]
+
+    def pending_parts(self, job_id):
+        """Parts of a job still to render; parts already done are skipped when a job resumes"""
+        return [part for part in self.get_parts(job_id) if part['status'] != 'done']
+
+    def set_part_status(self, job_id, part_number, status, output_path=None):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE parts SET status = ?, output_path = ?, updated_at = ? WHERE job_id = ? AND part_number = ?",
+                (status, output_path, self._now(), job_id, part_number))
+
+    def close(self):
+        self.conn.close()
+
+def image_order_key(path):
+    """Sort key for folder images: numbers compare by value and front comes before back.
+    
+    So front1, back1, front2, back2, ..., front10, back10 (or postcard_1_front,
+    postcard_1_back, ...) come out in postcard order.
+    """
+    name = os.path.splitext(os.path.basename(path))[0].lower()
+    side = 1 if 'back' in name and 'front' not in name else 0
+    stem = re.sub(r'front|back', '', name)
+    chunks = [(0, int(chunk), '') if chunk.isdigit() else (1, 0, chunk) for chunk in re.split(r'(\d+)', stem) if chunk]
+    return chunks, side, name
+
+def list_folder_images(folder):
+    return sorted((os.path.join(folder, name) for name in os.listdir(folder)
+                   if name.lower().endswith(IMAGE_EXTENSIONS)), key=image_order_key)
+
+def source_fingerprint(path):
+    """Identify one version of an inbox entry by its files' names, sizes and modification times"""
+    paths = [path] if os.path.isfile(path) else [os.path.join(path, name) for name in sorted(os.listdir(path))]
+    digest = hashlib.sha1()
+    newest = 0
+    for file_path in paths:
+        stat = os.stat(file_path)
+        newest = max(newest, stat.st_mtime)
+        digest.update(f"{os.path.basename(file_path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest(), newest
+
+def scan_inbox(queue, inbox_dir, settle_seconds):
+    """Queue new .xlsx sheets and image folders that have not changed for settle_seconds"""
+    os.makedirs(inbox_dir, exist_ok=True)
+    for name in sorted(os.listdir(inbox_dir)):
+        path = os.path.abspath(os.path.join(inbox_dir, name))
+        if name.startswith(('.', '~$')):
+            continue
+        if os.path.isfile(path) and name.lower().endswith('.xlsx'):
+            kind = 'excel'
+        elif os.path.isdir(path) and list_folder_images(path):
+            kind = 'images'
+        else:
+            continue
+
+        fingerprint, newest = source_fingerprint(path)
+        if time.time() - newest < settle_seconds:
+            continue  # Still being copied in
+        job_id = queue.enqueue(path, fingerprint, kind)
+        if job_id:
+            print(f"Queued job {job_id}: {path}")
+
+def prepare_job_images(queue, job, creator):
+    """Resolve a job's image list once; later attempts reuse it so the parts stay the same"""
+    if job['images']:
+        return json.loads(job['images'])
+    if job['kind'] == 'excel':
+        images = creator.download_excel_images(job['source'], print)
+    elif os.path.isfile(os.path.join(job['source'], 'images.txt')):
+        images = [os.path.join(job['source'], path)
+                  for path in creator.read_image_list(os.path.join(job['source'], 'images.txt'))]
+    else:
+        images = list_folder_images(job['source'])
+    queue.set_job_images(job['id'], images)
+    return images
+
+def process_job(queue, job, settings):
+    """Render the unfinished parts of a job; returns True when every part is done"""
+    from postcard_video_creator import PostcardVideoCreator, _render_part_job, prune_segment_cache
+
+    job_id = job['id']
+    print(f"Starting job {job_id}: {job['source']}")
+    queue.set_job_status(job_id, 'running')
+
+    os.makedirs(settings['output_dir'], exist_ok=True)
+    creator = PostcardVideoCreator.create_headless(
+        defaults_path=settings['defaults_path'],
+        output_path=settings['output_dir'],
+        resolution=settings['resolution'],
+        status_callback=lambda text: print(f"Job {job_id}: {text}"),
+    )
+    title_path = os.path.join(job['source'], 'title.txt')
+    if os.path.isfile(title_path):
+        with open(title_path, 'r', encoding='utf-8') as f:
+            creator.start_line1_var.set(f.read().strip())
+    original_title = creator.start_line1_var.get()
+
+    images = prepare_job_images(queue, job, creator)
+    if not images or len(images) % 2 != 0:
+        queue.set_job_status(job_id, 'failed', "Job needs an even number of images (front and back for each postcard)")
+        return False
+    creator.postcard_images = images
+    creator.image_durations = [creator.default_duration] * len(images)
+    creator.image_included = [True] * len(images)
+
+    parts = queue.get_parts(job_id)
+    if not parts:
+        batches = creator.calculate_video_batches()
+        queue.add_parts(job_id, [(creator._get_batch_part_number(index), batch) for index, batch in enumerate(batches)])
+        parts = queue.get_parts(job_id)
+
+    pending = queue.pending_parts(job_id)
+    print(f"Job {job_id}: {len(parts) - len(pending)}/{len(parts)} parts already rendered")
+    render_spec = creator.build_render_spec()
+    workers = max(1, min(settings['workers'] or creator.render_workers_var.get(), len(pending) or 1))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for part in pending:
+            queue.set_part_status(job_id, part['part_number'], 'running')
+            part_spec = {
+                'variables': dict(render_spec['variables'], start_line1_var=f"{original_title} #{part['part_number']}"),
+                'attributes': render_spec['attributes'],
+            }
+            future = executor.submit(_render_part_job, part_spec, part['batch'], part['part_number'],
+                                     len(parts), original_title)
+            futures[future] = part['part_number']
+
+        for future in as_completed(futures):
+            part_number = futures[future]
+            try:
+                output_path = future.result()
+            except Exception as e:
+                print(f"Job {job_id}: part {part_number} failed: {e}")
+                output_path = None
+            queue.set_part_status(job_id, part_number, 'done' if output_path else 'failed', output_path)
+            print(f"Job {job_id}: part {part_number} {'written to ' + output_path if output_path else 'failed'}")
+    prune_segment_cache()  # After every part has joined its segments
+
+    failed = [part['part_number'] for part in queue.get_parts(job_id) if part['status'] != 'done']
+    if failed:
+        queue.set_job_status(job_id, 'failed', f"Parts failed: {failed}")
+        return False
+    queue.set_job_status(job_id, 'done')
+    print(f"Finished job {job_id}")
+    return True
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Watch an inbox folder and render postcard videos")
+    parser.add_argument("--inbox", help="Folder to watch for .xlsx sheets and image folders")
+    parser.add_argument("--output", help="Folder to write the videos to")
+    parser.add_argument("--queue-db", help="SQLite file holding the job queue")
+    parser.add_argument("--defaults", help="Settings saved from the GUI")
+    parser.add_argument("--workers", type=int, help="Parts to render at once")
+    parser.add_argument("--once", action="store_true", help="Process the queue once and exit (for cron)")
+    parser.add_argument("--retry-failed", action="store_true", help="Requeue failed jobs and parts")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = parse_args(argv)
+    settings = get_watch_settings()
+    for key, value in (('inbox_dir', args.inbox), ('output_dir', args.output), ('queue_db', args.queue_db),
+                       ('defaults_path', args.defaults), ('workers', args.workers)):
+        if value is not None:
+            settings[key] = value
+
+    queue = RenderQueue(settings['queue_db'])
+    queue.reset_interrupted()
+    if args.retry_failed:
+        queue.retry_failed()
+    print(f"Watching {os.path.abspath(settings['inbox_dir'])} (queue: {settings['queue_db']})")
+
+    try:
+        while True:
+            scan_inbox(queue, settings['inbox_dir'], settings['settle_seconds'])
+            job = queue.next_job()
+            if job is not None:
+                try:
+                    process_job(queue, job, settings)
+                except Exception as e:
+                    print(f"Job {job['id']} failed: {e}")
+                    queue.set_job_status(job['id'], 'failed', str(e))
+                continue
+            if args.once:
+                break
+            time.sleep(settings['poll_interval'])
+    except KeyboardInterrupt:
+        print("Stopping; unfinished jobs resume on the next start")
+    finally:
+        queue.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
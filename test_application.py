@@ -159,6 +159,257 @@ def test_video_processing_logic():
         print(f"❌ Video processing test failed: {e}")
         return False
 
+def test_batch_planning():
+    """Test that the batch planner respects duration and minimum pair limits"""
+    print("\nTesting batch planning...")
+    
+    try:
+        from postcard_video_creator import plan_video_batches
+        
+        # 12 pairs of 10s into 45s parts: three parts of 4 pairs is the fewest possible
+        ranges = plan_video_batches([10.0] * 12, 45.0, min_pairs=3)
+        assert ranges == [(0, 4), (4, 8), (8, 12)], ranges
+        
+        # Uneven durations are balanced and every part stays within the limit
+        durations = [5.0, 20.0, 5.0, 20.0, 5.0, 5.0, 5.0]
+        ranges = plan_video_batches(durations, 40.0, min_pairs=2)
+        assert len(ranges) == 2, ranges
+        assert all(sum(durations[a:b]) <= 40.0 and b - a >= 2 for a, b in ranges), ranges
+        
+        # Parts sized with the timeline model include the start, second page and ending clips
+        from postcard_video_creator import VideoTimeline
+        timeline = VideoTimeline(start_duration=3.0, pair_duration=10.0, transition_duration=1.0,
+                                 ending_duration=5.0, second_page_duration=5.0)
+        # start 3 + second page 5 + first front 4.8 - crossfade 1 + 3 pairs of 10 + ending 5
+        assert abs(timeline.part_duration(3) - 46.8) < 1e-9, timeline.part_duration(3)
+        ranges = plan_video_batches([10.0] * 9, 60.0, min_pairs=3,
+                                    part_duration=lambda a, b: timeline.part_duration(b - a))
+        assert ranges == [(0, 3), (3, 6), (6, 9)], ranges
+        
+        # Large inputs stay fast
+        start = time.time()
+        ranges = plan_video_batches([12.0 + (i % 5) for i in range(5000)], 50.0, min_pairs=3)
+        elapsed = time.time() - start
+        assert ranges[-1][1] == 5000
+        print(f"✅ Batch planning works ({len(ranges)} parts for 5000 pairs in {elapsed * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"❌ Batch planning failed: {e}")
+        return False
+
+def test_frame_timeline():
+    """Test that clip boundaries snap to one frame grid without drift"""
+    print("\nTesting frame timeline...")
+    
+    try:
+        from postcard_video_creator import plan_clip_frames, FRAME_RATES
+        
+        durations = [4.05, 13.37, 13.37, 13.37, 8.0]
+        for fps in FRAME_RATES:
+            frames = plan_clip_frames(durations, fps)
+            assert sum(n for n, _ in frames) == round(sum(durations) * fps), (fps, frames)
+            assert all(abs(offset) <= 0.5 / fps + 1e-9 for _, offset in frames), (fps, frames)
+        
+        # Segments planned separately land on the same grid as the whole video
+        whole = plan_clip_frames(durations, 24)
+        split = plan_clip_frames(durations[:2], 24) + plan_clip_frames(durations[2:], 24, start_time=sum(durations[:2]))
+        assert whole == split, (whole, split)
+        print("✅ Frame timeline works")
+        return True
+    except Exception as e:
+        print(f"❌ Frame timeline failed: {e}")
+        return False
+
+def test_zoom_transition_centre():
+    """Test that both zoom directions scale the outgoing and incoming frames about the centre"""
+    print("\nTesting zoom transition centre...")
+    
+    try:
+        import numpy as np
+        from postcard_video_creator import ZoomTransition
+        
+        height, width = 200, 100
+        dot = np.zeros((height, width, 3), dtype=np.uint8)
+        dot[96:104, 46:54] = 255  # Centred at (49.5, 99.5)
+        blank = np.zeros_like(dot)
+        for zoom_type in ("in", "out"):
+            for frames in ((dot, blank), (blank, dot)):
+                transition = ZoomTransition(lambda f=frames[0]: f, lambda f=frames[1]: f, 1.0, zoom_type)
+                for progress in (0.25, 0.5, 0.75):
+                    weights = transition.frame(progress)[:, :, 0].astype(np.float64)
+                    ys, xs = np.indices(weights.shape)
+                    centre = ((xs * weights).sum() / weights.sum(), (ys * weights).sum() / weights.sum())
+                    assert abs(centre[0] - 49.5) < 0.6 and abs(centre[1] - 99.5) < 0.6, (zoom_type, progress, centre)
+        print("✅ Zoom transition stays centred")
+        return True
+    except Exception as e:
+        print(f"❌ Zoom transition centre failed: {e}")
+        return False
+
+def test_excel_row_parsing():
+    """Test that postcard rows are read from a minimal .xlsx, including rich text shared strings"""
+    print("\nTesting Excel row parsing...")
+    
+    try:
+        import io
+        import zipfile
+        from postcard_video_creator import PostcardVideoCreator
+        
+        ns = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+        shared_strings = (f'<sst {ns}><si><t>Title</t></si>'
+                          '<si><r><t>Old </t></r><r><rPr><b/></rPr><t>Harbour</t></r></si>'
+                          '<si><t>https://example.com/front.jpg|https://example.com/back.jpg</t></si></sst>')
+        sheet = (f'<worksheet {ns}><sheetData>'
+                 '<row r="1"><c r="D1" t="s"><v>0</v></c><c r="L1" t="inlineStr"><is><t>Image</t></is></c></row>'
+                 '<row r="2"><c r="A2"><v>7</v></c><c r="D2" t="s"><v>1</v></c><c r="L2" t="s"><v>2</v></c></row>'
+                 '<row r="3"><c r="E3" t="inlineStr"><is><t>Pier</t></is></c>'
+                 '<c r="L3" t="inlineStr"><is><t>https://example.com/pier.jpg</t></is></c></row>'
+                 '<row r="4"><c r="D4" t="inlineStr"><is><t>No image</t></is></c></row>'
+                 '</sheetData></worksheet>')
+        excel_file = io.BytesIO()
+        with zipfile.ZipFile(excel_file, 'w') as zip_file:
+            zip_file.writestr('xl/sharedStrings.xml', shared_strings)
+            zip_file.writestr('xl/worksheets/sheet1.xml', sheet)
+        excel_file.seek(0)
+        
+        creator = PostcardVideoCreator.__new__(PostcardVideoCreator)
+        rows = list(creator._iter_excel_rows(excel_file))
+        assert rows == [
+            {'title': 'Old Harbour', 'image_url': 'https://example.com/front.jpg|https://example.com/back.jpg', 'row': 2},
+            {'title': 'Pier', 'image_url': 'https://example.com/pier.jpg', 'row': 3},
+        ], rows
+        print("✅ Excel rows parsed")
+        return True
+    except Exception as e:
+        print(f"❌ Excel row parsing failed: {e}")
+        return False
+
+def test_render_queue():
+    """Test that the watch folder queue dedupes jobs and resumes interrupted work"""
+    print("\nTesting render queue...")
+    
+    try:
+        import tempfile
+        from postcard_video_daemon import RenderQueue, image_order_key
+        
+        names = ['back10.jpg', 'front2.jpg', 'back1.jpg', 'front10.jpg', 'back2.jpg', 'front1.jpg']
+        assert sorted(names, key=image_order_key) == [
+            'front1.jpg', 'back1.jpg', 'front2.jpg', 'back2.jpg', 'front10.jpg', 'back10.jpg'], sorted(names, key=image_order_key)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queue = RenderQueue(os.path.join(temp_dir, "queue.db"))
+            try:
+                job_id = queue.enqueue("/inbox/cards", "v1", "images")
+                assert job_id is not None
+                assert queue.enqueue("/inbox/cards", "v1", "images") is None  # Same version: not queued again
+                assert queue.enqueue("/inbox/cards", "v2", "images") not in (None, job_id)
+                
+                # A process stopped mid-job: the job and its running part are queued again
+                queue.set_job_status(job_id, 'running')
+                queue.add_parts(job_id, [(1, [0, 1]), (2, [2, 3]), (3, [4, 5])])
+                queue.set_part_status(job_id, 1, 'done', "part1.mp4")
+                queue.set_part_status(job_id, 2, 'running')
+                queue.reset_interrupted()
+                assert queue.next_job()['id'] == job_id
+                assert [part['status'] for part in queue.get_parts(job_id)] == ['done', 'queued', 'queued']
+                
+                # Resuming renders only the parts that are not done
+                assert [part['part_number'] for part in queue.pending_parts(job_id)] == [2, 3]
+                assert queue.pending_parts(job_id)[0]['batch'] == [2, 3]
+            finally:
+                queue.close()
+        print("✅ Render queue works")
+        return True
+    except Exception as e:
+        print(f"❌ Render queue failed: {e}")
+        return False
+
+def test_edge_transition_geometry():
+    """Test that slide and wipe frames match the original slice composites at whole-pixel positions"""
+    print("\nTesting slide and wipe geometry...")
+    
+    try:
+        import numpy as np
+        from postcard_video_creator import EdgeTransition
+        
+        def reference(frame1, frame2, mode, direction, progress):
+            # The slide/wipe composites from before EdgeTransition
+            height, width = frame1.shape[:2]
+            composite = frame1.copy()
+            if mode == "slide":
+                portion = int((height if direction in ("up", "down") else width) * progress)
+                if portion > 0:
+                    if direction == "left":
+                        composite[:, :portion] = frame2[:, -portion:]
+                    elif direction == "right":
+                        composite[:, -portion:] = frame2[:, :portion]
+                    elif direction == "up":
+                        composite[:portion, :] = frame2[-portion:, :]
+                    elif direction == "down":
+                        composite[-portion:, :] = frame2[:portion, :]
+            else:
+                if direction == "left":
+                    line = int(width * progress)
+                    composite[:, :line] = frame2[:, :line]
+                elif direction == "right":
+                    line = int(width * (1 - progress))
+                    composite[:, line:] = frame2[:, line:]
+                elif direction == "up":
+                    line = int(height * progress)
+                    composite[:line, :] = frame2[:line, :]
+                elif direction == "down":
+                    line = int(height * (1 - progress))
+                    composite[line:, :] = frame2[line:, :]
+            return composite
+        
+        rng = np.random.default_rng(0)
+        frame1 = rng.integers(0, 256, (40, 64, 3), dtype=np.uint8)
+        frame2 = rng.integers(0, 256, (40, 64, 3), dtype=np.uint8)
+        for mode in ("slide", "wipe"):
+            for direction in ("left", "right", "up", "down"):
+                transition = EdgeTransition(lambda: frame1, lambda: frame2, mode, direction)
+                # 40 and 64 times each progress are whole numbers of lines
+                for progress in (0.0, 0.25, 0.5, 0.75, 1.0):
+                    expected = reference(frame1, frame2, mode, direction, progress)
+                    assert np.array_equal(transition.frame(progress), expected), (mode, direction, progress)
+        print("✅ Slide and wipe frames match the original geometry")
+        return True
+    except Exception as e:
+        print(f"❌ Slide and wipe geometry failed: {e}")
+        return False
+
+def test_dissolve_seed():
+    """Test that the dissolve pattern depends only on the seed and cannot be changed by callers"""
+    print("\nTesting dissolve seed...")
+    
+    try:
+        import numpy as np
+        from postcard_video_creator import DissolveTransition, get_dissolve_thresholds
+        
+        black = np.zeros((48, 64, 3), dtype=np.uint8)
+        white = np.full((48, 64, 3), 255, dtype=np.uint8)
+        
+        def dissolve_frames(seed):
+            transition = DissolveTransition(lambda: black, lambda: white, seed=seed)
+            return [transition.frame(progress).copy() for progress in (0.25, 0.5, 0.75)]
+        
+        first, second, other = dissolve_frames(7), dissolve_frames(7), dissolve_frames(8)
+        assert all(np.array_equal(a, b) for a, b in zip(first, second)), "same seed gave different frames"
+        assert not any(np.array_equal(a, b) for a, b in zip(first, other)), "different seeds gave the same frames"
+        
+        thresholds = get_dissolve_thresholds(48, 64, 7)
+        assert not thresholds.flags.writeable
+        try:
+            thresholds[0, 0] = 0
+            raise AssertionError("cached thresholds were writable")
+        except ValueError:
+            pass
+        print("✅ Dissolve pattern follows the seed")
+        return True
+    except Exception as e:
+        print(f"❌ Dissolve seed failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("Postcard Video Creator - Application Test")
@@ -169,7 +420,14 @@ def main():
         test_image_loading,
         test_application_import,
         test_gui_creation,
-        test_video_processing_logic
+        test_video_processing_logic,
+        test_batch_planning,
+        test_frame_timeline,
+        test_zoom_transition_centre,
+        test_excel_row_parsing,
+        test_render_queue,
+        test_edge_transition_geometry,
+        test_dissolve_seed
     ]
     
     passed = 0